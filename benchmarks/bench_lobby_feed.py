@@ -0,0 +1,90 @@
+"""DB queries per minute: N idle lobbies polling /?tier=1k vs N lobbies connected to /lobby/stream.
+
+Runs against a throwaway SQLite file. One game is created halfway through each phase so the
+stream phase also shows the delta actually reaching every subscriber. The stream phase count
+includes the lobby relay's poll of the shared event table (one query per LOBBY_POLL_INTERVAL).
+Usage: python benchmarks/bench_lobby_feed.py [lobbies] [seconds] [poll_interval]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+LOBBIES = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+DURATION = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+POLL_INTERVAL = float(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+tmp = tempfile.mkdtemp()
+os.environ.setdefault('DATABASE_URL', 'sqlite:///' + os.path.join(tmp, 'bench.db'))
+os.environ.setdefault('LOBBY_STREAM_SLOTS', str(LOBBIES)) # One process serves every lobby here
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datetime import datetime, timedelta
+from sqlalchemy import event
+import file_admin as fa
+
+app = fa.create_app()
+fa.LOBBY_HEARTBEAT = 0.5 # Lets stream threads notice the stop flag quickly
+queries = [0]
+
+def count_query(*args):
+    queries[0] += 1
+
+def client_for(user_id):
+    c = app.test_client()
+    with c.session_transaction() as sess:
+        sess['_user_id'] = str(user_id)
+        sess['_fresh'] = True
+    return c
+
+def setup():
+    with app.app_context():
+        fa.db.create_all()
+        fa.seed_vault()
+        expiry = datetime.now() + timedelta(days=1)
+        fa.db.session.add_all([fa.User(username=f'p{i}', balance=100000, sub_expiry=expiry) for i in range(LOBBIES + 1)])
+        fa.db.session.commit()
+        event.listen(fa.db.engine, 'before_cursor_execute', count_query)
+
+def create_game(creator):
+    creator.post('/create_game', data=dict(stake='1000', choice='Red', hint='Pure Luck'))
+
+def phase(worker, creator):
+    stop = threading.Event()
+    received = []
+    threads = [threading.Thread(target=worker, args=(client_for(i + 2), stop, received)) for i in range(LOBBIES)]
+    for t in threads: t.start()
+    time.sleep(0.5) # Let every lobby connect before counting
+    queries[0] = 0
+    time.sleep(DURATION / 2)
+    create_game(creator)
+    time.sleep(DURATION / 2)
+    counted = queries[0]
+    stop.set()
+    for t in threads: t.join()
+    return counted * 60 / DURATION, len(received)
+
+def poller(client, stop, received):
+    while not stop.is_set():
+        client.get('/?tier=1k')
+        stop.wait(POLL_INTERVAL)
+
+def streamer(client, stop, received):
+    resp = client.get('/lobby/stream?tier=1k', buffered=False)
+    for chunk in resp.response:
+        if b'event: created' in chunk: received.append(chunk)
+        if stop.is_set(): break
+    resp.close()
+
+def main():
+    setup()
+    creator = client_for(1)
+    poll_qpm, _ = phase(poller, creator)
+    stream_qpm, deltas = phase(streamer, creator)
+    print(f"{LOBBIES} lobbies, {DURATION:.0f}s per phase, polling every {POLL_INTERVAL:.0f}s")
+    print(f"polling: {poll_qpm:>8.0f} queries/min")
+    print(f"stream:  {stream_qpm:>8.0f} queries/min ({deltas}/{LOBBIES} lobbies received the new game)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Rate-limit flood check: database work must stay flat as the request count grows.
+
+Floods /transact (one logged-in player) and /login (one anonymous IP) through Flask's test
+client with 10x more requests each round and counts the SQL statements the app issues.
+Runs once with the in-process buckets and once with the shared SQLite-file backend.
+Usage: python benchmarks/bench_rate_limit.py [max_requests]
+"""
+import os
+import sys
+import tempfile
+import time
+
+TMP = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f'sqlite:///{os.path.join(TMP, "bench.db")}'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+import file_admin as fa
+
+MAX_REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+statements = 0
+
+def count_sql(*args):
+    global statements
+    statements += 1
+
+def flood(app, user_id, ip, path, data, n):
+    global statements
+    client = app.test_client()
+    client.environ_base['REMOTE_ADDR'] = ip
+    if user_id:
+        with client.session_transaction() as s: s['_user_id'] = str(user_id)
+    statements, rejected = 0, 0
+    start = time.perf_counter()
+    for _ in range(n):
+        rejected += client.post(path, data=data).status_code == 429
+    return n - rejected, rejected, statements, time.perf_counter() - start
+
+def main():
+    app = fa.create_app()
+    with app.app_context():
+        fa.migrate()
+        fa.seed_vault()
+        event.listen(fa.db.engine, 'before_cursor_execute', count_sql)
+
+    backends = {'memory': fa.TokenBuckets(fa.RATE_LIMIT_MAX_KEYS),
+                'shared file': fa.SharedTokenBuckets(os.path.join(TMP, 'limits.db'))}
+    print(f"{'backend':<12} {'route':<10} {'requests':>8} {'accepted':>8} {'429s':>6} {'SQL':>5} {'us/req':>7}")
+    user_id = 0
+    for backend, limiter in backends.items():
+        fa.rate_limiter = limiter
+        n = 50
+        while n <= MAX_REQUESTS:
+            user_id += 1
+            with app.app_context():
+                fa.db.session.add(fa.User(id=user_id, username=f'flood{user_id}', password='x', balance=10 ** 6))
+                fa.db.session.commit()
+            for route, uid, path, data in (('transact', user_id, '/transact', {'type': 'deposit', 'amount': '1'}),
+                                           ('login', None, '/login', {'username': 'nobody', 'password': 'x'})):
+                accepted, rejected, sql, seconds = flood(app, uid, f'10.0.0.{user_id}', path, data, n)
+                print(f"{backend:<12} {route:<10} {n:>8} {accepted:>8} {rejected:>6} {sql:>5} {seconds / n * 1e6:>7.0f}")
+            n *= 10
+
+if __name__ == '__main__':
+    main()
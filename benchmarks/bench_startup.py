@@ -0,0 +1,67 @@
+"""Startup profile: import, app construction, warm-up and first-request time, eager vs LAZY_INIT=1.
+
+Every sample is a fresh interpreter, so imports are cold. "new db" starts from an empty SQLite
+file (tables created, migrations applied); "existing db" restarts against the database the
+previous sample left behind, like a redeploy or a scale-out worker. Ready is the time from
+interpreter start until the first page has been served. Medians over --runs samples, in ms.
+Usage: python benchmarks/bench_startup.py [--runs N] [--path /login]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHASES = ('import', 'create_app', 'warm_up', 'first_request', 'ready')
+
+def sample(path):
+    # Runs in the child interpreter; LAZY_INIT and DATABASE_URL come from the environment
+    started = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    import file_admin as fa
+    imported = time.perf_counter()
+    app = fa.create_app()
+    created = time.perf_counter()
+    if not fa.LAZY_INIT: fa.warm_up(app) # What the gunicorn master does before forking
+    warm = time.perf_counter()
+    status = app.test_client().get(path).status_code
+    served = time.perf_counter()
+    assert status == 200, f"{path} answered {status}"
+    print(json.dumps({'import': imported - started, 'create_app': created - imported, 'warm_up': warm - created,
+                      'first_request': served - warm, 'ready': served - started}))
+
+def run(lazy, db_path, path):
+    env = dict(os.environ, LAZY_INIT='1' if lazy else '0', DATABASE_URL=f'sqlite:///{db_path}', HASH_WORKERS='1')
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--sample', path], env=env, cwd=os.path.dirname(db_path),
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--path', default='/login')
+    parser.add_argument('--sample', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.sample: return sample(args.sample)
+
+    print(f"{'mode':<6} {'database':<12}" + ''.join(f" {p:>13}" for p in PHASES))
+    for lazy in (False, True):
+        for database in ('new db', 'existing db'):
+            samples = []
+            with tempfile.TemporaryDirectory() as tmp:
+                db_path = os.path.join(tmp, 'bench.db')
+                if database == 'existing db': run(lazy, db_path, args.path)
+                for _ in range(args.runs):
+                    if database == 'new db' and os.path.exists(db_path):
+                        for suffix in ('', '-wal', '-shm'):
+                            if os.path.exists(db_path + suffix): os.remove(db_path + suffix)
+                    samples.append(run(lazy, db_path, args.path))
+            medians = [statistics.median(s[p] for s in samples) * 1000 for p in PHASES]
+            print(f"{'lazy' if lazy else 'eager':<6} {database:<12}" + ''.join(f" {m:>13.1f}" for m in medians))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Micro-benchmark: per-request render_template_string with inlined CSS vs the precompiled registry.
+
+Usage: python benchmarks/bench_templates.py [iterations]
+"""
+import os
+import sys
+import timeit
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import render_template, render_template_string
+import file_admin as fa
+
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+user = SimpleNamespace(id=1, username='bench', balance=125000, is_admin=False)
+games = [fa.LobbyGame(i, 1000, 'Pure Luck', 2, datetime.now(), 'player%d' % i) for i in range(20)]
+game = SimpleNamespace(id=1, stake=1000, hint='Pure Luck')
+
+PAGES = {
+    'dashboard': (fa.dashboard_html, dict(games=games, tier='1k')),
+    'paywall': (fa.paywall_html, {}),
+    'play': (fa.play_html, dict(game=game)),
+    'wallet': (fa.wallet_html, {}),
+    'auth': (fa.auth_html, dict(mode='login', title='LOGIN', btn_text='ENTER', link_text='New?', link_url='/register')),
+}
+
+def inline(src):
+    # What every page looked like before: the whole stylesheet pasted into <head>
+    return src.replace(fa.style_link, '<style>' + fa.common_style + '</style>')
+
+def main():
+    print(f"{'page':<10} {'before us':>10} {'after us':>10} {'before B':>9} {'after B':>8}")
+    app = fa.create_app()
+    with app.test_request_context('/'):
+        for name, (src, ctx) in PAGES.items():
+            ctx = dict(ctx, current_user=user)
+            old_src = inline(src)
+
+            before = lambda: render_template_string(old_src, **ctx)
+            after = lambda: fa.render(name, **ctx)
+
+            t_before = timeit.timeit(before, number=ITERATIONS) / ITERATIONS * 1e6
+            t_after = timeit.timeit(after, number=ITERATIONS) / ITERATIONS * 1e6
+            print(f"{name:<10} {t_before:>10.1f} {t_after:>10.1f} {len(before().encode()):>9} {len(after().encode()):>8}")
+    print(f"stylesheet: {len(fa.common_style.encode())} B, fetched once per version and cached for a year")
+
+if __name__ == '__main__':
+    main()
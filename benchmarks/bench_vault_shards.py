@@ -0,0 +1,64 @@
+"""Concurrency benchmark: settlement-style commission credits against 1 vault shard vs N shards.
+
+Each worker thread repeatedly credits a commission and commits, like resolve_game does.
+Usage: python benchmarks/bench_vault_shards.py [threads] [credits_per_thread] [shards]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+import file_admin as fa
+
+THREADS = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+CREDITS = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+SHARDS = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+
+def run(shards, url):
+    bench_app = Flask('bench_vault')
+    bench_app.config['SQLALCHEMY_DATABASE_URI'] = url
+    fa.db.init_app(bench_app)
+    fa.VAULT_SHARDS = shards
+    with bench_app.app_context():
+        fa.db.drop_all()
+        fa.db.create_all()
+        fa.seed_vault()
+
+    errors = []
+    def worker():
+        with bench_app.app_context():
+            for _ in range(CREDITS):
+                try:
+                    fa.credit_vault(commission=200)
+                    fa.db.session.commit()
+                except Exception as e:
+                    fa.db.session.rollback()
+                    errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    start = time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    elapsed = time.perf_counter() - start
+
+    with bench_app.app_context():
+        total = fa.vault_totals().commission_balance
+        fa.db.engine.dispose()
+    ok = THREADS * CREDITS - len(errors)
+    assert total == ok * 200, (total, ok)
+    return ok / elapsed, len(errors)
+
+def main():
+    print(f"{THREADS} threads x {CREDITS} credits")
+    for shards in (1, SHARDS):
+        with tempfile.TemporaryDirectory() as tmp:
+            url = os.environ.get('BENCH_DATABASE_URL') or 'sqlite:///' + os.path.join(tmp, 'vault.db')
+            rate, errors = run(shards, url)
+            print(f"shards={shards:<3} {rate:>8.0f} credits/s  errors={errors}")
+
+if __name__ == '__main__':
+    main()
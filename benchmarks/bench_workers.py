@@ -0,0 +1,112 @@
+"""Worker scaling benchmark: requests per second under gunicorn with 1..N worker processes.
+
+Starts gunicorn.conf.py against a fresh SQLite file for each worker count, signs up one
+player over HTTP, then runs CLIENTS keep-alive client processes polling PATHS for DURATION
+seconds. The client processes share the machine with the server, so leave cores for them.
+Usage: python benchmarks/bench_workers.py [--max-workers N] [--threads T] [--clients C] [--duration S]
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.parse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASSWORD = 'Bench!pass1'
+
+def request(conn, method, path, cookie=None, body=None, json_body=None):
+    headers = {'Cookie': cookie} if cookie else {}
+    if json_body is not None:
+        body, headers['Content-Type'] = json.dumps(json_body), 'application/json'
+    elif body is not None:
+        body, headers['Content-Type'] = urllib.parse.urlencode(body), 'application/x-www-form-urlencoded'
+    conn.request(method, path, body=body, headers=headers)
+    resp = conn.getresponse()
+    resp.read()
+    return resp
+
+def wait_for(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not start")
+
+def sign_up(port):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    request(conn, 'POST', '/register', body={'username': 'bench', 'password': PASSWORD})
+    resp = request(conn, 'POST', '/login', body={'username': 'bench', 'password': PASSWORD})
+    cookie = resp.getheader('Set-Cookie').split(';', 1)[0]
+    request(conn, 'POST', '/pay_sub', cookie=cookie)
+    request(conn, 'POST', '/api/v1/games/batch', cookie=cookie,
+            json_body={'games': [{'tier': '1k', 'choice': 'Red', 'hint': f'game {i}'} for i in range(3)]})
+    conn.close()
+    return cookie
+
+def client(port, cookie, paths, duration):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    latencies, errors, i = [], 0, 0
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        start = time.perf_counter()
+        try:
+            status = request(conn, 'GET', paths[i % len(paths)], cookie=cookie).status
+        except (OSError, http.client.HTTPException):
+            status = None
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        latencies.append(time.perf_counter() - start)
+        errors += status != 200
+        i += 1
+    return latencies, errors
+
+def run(workers, args):
+    port = args.port + workers
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f'sqlite:///{os.path.join(tmp, "bench.db")}',
+                   JOB_LOCK_FILE=os.path.join(tmp, 'jobs.lock'), HASH_WORKERS='1')
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-c', os.path.join(ROOT, 'gunicorn.conf.py'), '--chdir', ROOT,
+             '--bind', f'127.0.0.1:{port}', '--workers', str(workers), '--threads', str(args.threads),
+             '--log-level', 'warning'], env=env)
+        try:
+            wait_for(port)
+            cookie = sign_up(port)
+            with multiprocessing.Pool(args.clients) as pool:
+                results = pool.starmap(client, [(port, cookie, args.paths, args.duration)] * args.clients)
+        finally:
+            server.terminate()
+            server.wait()
+    latencies = sorted(l for lats, _ in results for l in lats)
+    errors = sum(e for _, e in results)
+    pct = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+    return len(latencies) / args.duration, pct(0.5), pct(0.99), errors
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--port', type=int, default=18000)
+    parser.add_argument('--paths', nargs='+', default=['/api/v1/lobby/1k', '/api/v1/wallet', '/'])
+    args = parser.parse_args()
+
+    print(f"{args.clients} clients, {args.threads} threads/worker, {args.duration:g}s per run, paths {' '.join(args.paths)}")
+    print(f"{'workers':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7} {'speedup':>8}")
+    base = None
+    for workers in range(1, args.max_workers + 1):
+        rps, p50, p99, errors = run(workers, args)
+        base = base or rps
+        print(f"{workers:>7} {rps:>9.0f} {p50:>8.1f} {p99:>8.1f} {errors:>7} {rps / base:>7.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Write-contention benchmark for the SQLite storage settings.
+
+Runs the same mix of concurrent writers (balance debit + vault credit + commit, like
+resolve_game) and lobby readers under each pragma profile, each in a fresh process and a
+fresh database file, and reports write throughput, tail latency and lock errors.
+Usage: python benchmarks/bench_write_contention.py [writers] [writes_per_writer] [readers]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+WORKER = '--worker' in sys.argv
+ARGS = [a for a in sys.argv[1:] if a != '--worker']
+WRITERS = int(ARGS[0]) if len(ARGS) > 0 else 8
+WRITES = int(ARGS[1]) if len(ARGS) > 1 else 200
+READERS = int(ARGS[2]) if len(ARGS) > 2 else 4
+
+PROFILES = {
+    'rollback journal, synchronous=FULL': {'SQLITE_JOURNAL_MODE': 'DELETE', 'SQLITE_SYNCHRONOUS': 'FULL'},
+    'WAL, synchronous=FULL': {'SQLITE_JOURNAL_MODE': 'WAL', 'SQLITE_SYNCHRONOUS': 'FULL'},
+    'WAL, synchronous=NORMAL (default)': {},
+}
+
+def worker():
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import file_admin as fa
+
+    app = fa.create_app()
+    with app.app_context():
+        fa.db.create_all()
+        fa.seed_vault()
+        fa.db.session.add_all([fa.User(username=f'w{i}', balance=10 ** 9) for i in range(WRITERS)])
+        fa.db.session.add_all([fa.Game(stake=1000, creator_id=1, creator_choice='Red') for _ in range(200)])
+        fa.db.session.commit()
+
+    latencies, errors, done = [], [], threading.Event()
+    def write(user_id):
+        with app.app_context():
+            for _ in range(WRITES):
+                start = time.perf_counter()
+                try:
+                    fa.adjust_balance(user_id, -1)
+                    fa.credit_vault(commission=1)
+                    fa.db.session.commit()
+                    latencies.append(time.perf_counter() - start)
+                except Exception as e:
+                    fa.db.session.rollback()
+                    errors.append(type(e).__name__)
+
+    def read():
+        with app.app_context():
+            while not done.is_set():
+                fa.load_lobby(1000)
+                fa.db.session.rollback()
+
+    readers = [threading.Thread(target=read) for _ in range(READERS)]
+    writers = [threading.Thread(target=write, args=(i + 1,)) for i in range(WRITERS)]
+    for t in readers: t.start()
+    start = time.perf_counter()
+    for t in writers: t.start()
+    for t in writers: t.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    for t in readers: t.join()
+
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0
+    print(json.dumps({'writes_per_s': len(latencies) / elapsed, 'p50_ms': pct(0.50),
+                      'p99_ms': pct(0.99), 'errors': len(errors)}))
+
+def main():
+    print(f"{WRITERS} writers x {WRITES} writes, {READERS} lobby readers")
+    for name, env in PROFILES.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(os.environ, DATABASE_URL='sqlite:///' + os.path.join(tmp, 'bench.db'), **env)
+            out = subprocess.run([sys.executable, __file__, '--worker'] + ARGS, env=env,
+                                 capture_output=True, text=True, check=True).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            print(f"{name:<36} {r['writes_per_s']:>7.0f} writes/s  p50 {r['p50_ms']:>6.1f} ms  "
+                  f"p99 {r['p99_ms']:>7.1f} ms  errors {r['errors']}")
+
+if __name__ == '__main__':
+    if WORKER:
+        worker()
+    else:
+        main()
@@ -0,0 +1,160 @@
+"""Load test: N concurrent players run the full lifecycle against the app through Flask's test client.
+
+Each player registers, logs in, deposits and buys the daily pass. Then half of them create
+games across the six stake tiers while the other half browse the lobby and challenge open
+games, so challengers really do race each other for the same games. Every player sends from its
+own address. Rate limits are off unless --rate-limits is given; 429s are reported on their own.
+
+Reports throughput, p50/p95/p99 latency and SQL statements per request for every route,
+plus settlement outcomes, and writes everything to a JSON file for comparing runs.
+
+Usage: python benchmarks/loadtest.py --players 40 --rounds 20 --output loadtest.json
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument('--players', type=int, default=40)
+parser.add_argument('--rounds', type=int, default=20, help='games created or challenged per player')
+parser.add_argument('--output', default='loadtest.json')
+parser.add_argument('--database-url', help='defaults to a throwaway SQLite file')
+parser.add_argument('--rate-limits', action='store_true', help='keep the per-route rate limits on')
+args = parser.parse_args()
+
+os.environ['DATABASE_URL'] = args.database_url or 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'loadtest.db')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+import file_admin as fa
+
+app = fa.create_app()
+if not args.rate_limits: fa.RATE_LIMITS.clear() # Measure the app, not the limiter
+STAKES = {'1k': '1000', '2k': '2000', '5k': '5000', '10k': '10000', '20k': '20000', '50k': '50000'}
+PLAY_LINK = re.compile(rb'href="/play/(\d+)"')
+
+_local = threading.local()
+_results_lock = threading.Lock()
+latencies = defaultdict(list) # route -> [seconds]
+sql_counts = defaultdict(list) # route -> [statements]
+errors = defaultdict(int) # route -> responses >= 400 other than 429
+rate_limited = defaultdict(int) # route -> 429s
+outcomes = defaultdict(int)
+
+def count_sql(*_):
+    _local.sql = getattr(_local, 'sql', 0) + 1
+
+def timed(route, call, *a, **kw):
+    _local.sql = 0
+    start = time.perf_counter()
+    resp = call(*a, **kw)
+    elapsed = time.perf_counter() - start
+    with _results_lock:
+        latencies[route].append(elapsed)
+        sql_counts[route].append(_local.sql)
+        if resp.status_code == 429: rate_limited[route] += 1
+        elif resp.status_code >= 400: errors[route] += 1
+    return resp
+
+def with_retry(route, call, *a, **kw):
+    # Overloaded password hashing (503) and rate limits (429) send Retry-After; a real client backs off and retries
+    for _ in range(20):
+        resp = timed(route, call, *a, **kw)
+        if resp.status_code not in (429, 503): return resp
+        time.sleep(float(resp.headers.get('Retry-After', 1)) * random.random())
+    return resp
+
+def create_game(c):
+    tier = random.choice(list(STAKES))
+    timed('create_game', c.post, '/create_game', data=dict(stake=STAKES[tier], choice=random.choice(['Red', 'Black']), hint='Pure Luck'))
+
+def player(n, creator, ready, seeded):
+    c = app.test_client()
+    c.environ_base['REMOTE_ADDR'] = f'10.0.{n // 256}.{n % 256}' # One address per player, as behind PROXY_HOPS
+    name = f'player{n}'
+    with_retry('register', c.post, '/register', data=dict(username=name, password='Load!Test1', phone=str(n), country_code='+256'))
+    with_retry('login', c.post, '/login', data=dict(username=name, password='Load!Test1'))
+    timed('deposit', c.post, '/transact', data=dict(type='deposit', amount='2000000'))
+    timed('pay_sub', c.post, '/pay_sub')
+    ready.wait()
+
+    # Creators seed half their games before challengers arrive, then keep creating under load
+    if creator:
+        for _ in range(args.rounds // 2): create_game(c)
+    seeded.wait()
+    if creator:
+        for _ in range(args.rounds - args.rounds // 2): create_game(c)
+        return
+
+    for _ in range(args.rounds):
+        tier = random.choice(list(STAKES))
+        lobby = timed('lobby', c.get, f'/?tier={tier}')
+        ids = PLAY_LINK.findall(lobby.data)
+        if not ids:
+            with _results_lock: outcomes['empty_lobby'] += 1
+            continue
+        game_id = int(random.choice(ids[:5])) # Everyone aims at the oldest games, like real players
+        timed('play', c.get, f'/play/{game_id}')
+        resp = timed('resolve_game', c.post, f'/resolve_game/{game_id}', data=dict(guess=random.choice(['Red', 'Black'])))
+        with _results_lock:
+            if resp.status_code == 302 and resp.headers['Location'].endswith('/wallet'): outcomes['insufficient_funds'] += 1
+            elif resp.status_code == 302: outcomes['settled'] += 1
+            elif resp.status_code == 429: outcomes['rate_limited'] += 1
+            else: outcomes['conflict'] += 1 # "Game closed": another challenger claimed it first
+
+def pct(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] if values else 0
+
+def main():
+    with app.app_context():
+        fa.migrate()
+        fa.seed_vault()
+        event.listen(fa.db.engine, 'before_cursor_execute', count_sql)
+
+    ready, seeded = threading.Barrier(args.players), threading.Barrier(args.players)
+    threads = [threading.Thread(target=player, args=(n, n % 2 == 0, ready, seeded)) for n in range(args.players)]
+    start = time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    duration = time.perf_counter() - start
+
+    total = sum(len(v) for v in latencies.values())
+    report = {
+        'players': args.players,
+        'rounds': args.rounds,
+        'rate_limits': args.rate_limits,
+        'database': os.environ['DATABASE_URL'].split('@')[-1], # Drop credentials
+        'duration_s': round(duration, 3),
+        'requests': total,
+        'throughput_rps': round(total / duration, 1),
+        'routes': {route: {
+            'count': len(values),
+            'errors': errors[route],
+            'rate_limited': rate_limited[route],
+            'p50_ms': round(pct(values, 0.50) * 1000, 2),
+            'p95_ms': round(pct(values, 0.95) * 1000, 2),
+            'p99_ms': round(pct(values, 0.99) * 1000, 2),
+            'sql_per_request': round(sum(sql_counts[route]) / len(values), 2),
+        } for route, values in latencies.items()},
+        'settlements': dict(outcomes, engine=dict(fa.settlement_stats)),
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{total} requests in {duration:.1f}s = {report['throughput_rps']} req/s")
+    print(f"{'route':<14}{'count':>7}{'err':>5}{'429':>5}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'sql/req':>9}")
+    for route, r in report['routes'].items():
+        print(f"{route:<14}{r['count']:>7}{r['errors']:>5}{r['rate_limited']:>5}{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}{r['sql_per_request']:>9}")
+    print(f"settlements: {report['settlements']}")
+    print(f"written to {args.output}")
+
+if __name__ == '__main__':
+    main()
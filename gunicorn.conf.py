@@ -0,0 +1,29 @@
+# Production server: gunicorn -c gunicorn.conf.py
+# Multi-process, multi-threaded (gthread) workers, each building its own app via create_app().
+import multiprocessing
+import os
+
+wsgi_app = 'file_admin:create_app()'
+bind = os.environ.get('BIND', '0.0.0.0:8080')
+workers = int(os.environ.get('WEB_WORKERS', multiprocessing.cpu_count()))
+threads = int(os.environ.get('WEB_THREADS', 4))
+worker_class = 'gthread'
+timeout = int(os.environ.get('WEB_TIMEOUT', 30))
+keepalive = 5
+accesslog = os.environ.get('ACCESS_LOG') # '-' for stdout
+
+def on_starting(server):
+    # Once, in the master, before any worker is forked. With LAZY_INIT=1 the workers warm up instead.
+    import file_admin
+    if file_admin.LAZY_INIT: return
+    app = file_admin.create_app()
+    state = file_admin.warm_up(app)
+    with app.app_context():
+        if file_admin.REPLICA_SNAPSHOT: file_admin.refresh_replica_snapshot() # Workers read from it right away
+        for engine in file_admin.db.engines.values(): engine.dispose() # No pooled connection may be shared across the fork
+    server.log.info("Schema ready, applied migrations: %s", state['migrations'] or 'none')
+
+def post_worker_init(worker):
+    import file_admin
+    if file_admin.LAZY_INIT: file_admin.start_warm_up(worker.wsgi) # /healthz/ready turns 200 when done
+    file_admin.start_background_jobs(worker.wsgi)
@@ -0,0 +1,76 @@
+"""Lobby events are written by the commit that changes the games: one INSERT per batch, none on
+rollback. Closed games leave the quick-play queues."""
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+import file_admin as fa
+
+def lobby_app(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'lobby.db'}")
+    monkeypatch.setattr(fa, 'RATE_LIMITS', {})
+    app = fa.create_app()
+    expiry = datetime.now() + timedelta(hours=1)
+    with app.app_context():
+        fa.migrate()
+        fa.seed_vault()
+        fa.db.session.add(fa.User(id=1, username='maker', password='x', balance=10 ** 6, sub_expiry=expiry))
+        fa.db.session.add(fa.User(id=2, username='taker', password='x', balance=10 ** 6, sub_expiry=expiry))
+        fa.db.session.add(fa.User(id=3, username='broke', password='x', balance=0, sub_expiry=expiry))
+        fa.db.session.commit()
+    return app
+
+def client_for(app, user_id):
+    client = app.test_client()
+    with client.session_transaction() as sess: sess['_user_id'] = str(user_id)
+    return client
+
+def lobby_events(app):
+    with app.app_context():
+        return fa.db.session.execute(fa.select(fa.LobbyEvent.stake, fa.LobbyEvent.event)).all()
+
+def test_batch_writes_events_in_one_commit(tmp_path, monkeypatch):
+    app = lobby_app(tmp_path, monkeypatch)
+    statements, commits = [], []
+    with app.app_context():
+        event.listen(fa.db.engine, 'before_cursor_execute', lambda conn, cur, sql, *args: statements.append(sql))
+        event.listen(fa.db.engine, 'commit', lambda conn: commits.append(1))
+
+    games = [{'tier': tier, 'choice': 'RED'} for tier in ('1k', '2k')] * 25
+    ids = [r['id'] for r in client_for(app, 1).post('/api/v1/games/batch', json={'games': games}).get_json()['results']]
+    assert len(commits) == 1
+    assert sum(sql.startswith('INSERT INTO lobby_event') for sql in statements) == 1
+
+    statements.clear(), commits.clear()
+    picks = [{'id': game_id, 'guess': 'RED'} for game_id in ids]
+    results = client_for(app, 2).post('/api/v1/games/resolve', json={'games': picks}).get_json()['results']
+    assert all('won' in r for r in results)
+    assert len(commits) == 1
+    assert sum(sql.startswith('INSERT INTO lobby_event') for sql in statements) == 1
+    assert sorted(lobby_events(app)) == sorted([(1000, 'created'), (2000, 'created'), (1000, 'closed'), (2000, 'closed')] * 25)
+
+def test_rolled_back_settle_publishes_nothing(tmp_path, monkeypatch):
+    app = lobby_app(tmp_path, monkeypatch)
+    game_id = client_for(app, 1).post('/api/v1/games', json={'tier': '1k', 'choice': 'RED'}).get_json()['id']
+    assert client_for(app, 3).post(f'/api/v1/games/{game_id}/resolve', json={'guess': 'RED'}).status_code == 402
+    assert lobby_events(app) == [(1000, 'created')]
+
+def test_closed_games_leave_match_queue(tmp_path, monkeypatch):
+    app = lobby_app(tmp_path, monkeypatch)
+    maker, taker = client_for(app, 1), client_for(app, 2)
+    ids = []
+    for _ in range(4):
+        results = maker.post('/api/v1/games/batch', json={'games': [{'tier': '1k', 'choice': 'RED'}] * 50}).get_json()['results']
+        ids += [r['id'] for r in results]
+    with app.app_context(): fa.rebuild_queues()
+    for start in range(0, 199, 50):
+        picks = [{'id': game_id, 'guess': 'RED'} for game_id in ids[start:min(start + 50, 199)]]
+        taker.post('/api/v1/games/resolve', json={'games': picks})
+    assert list(fa._match_queues[1000]) == [ids[-1]]
+
+    statements = []
+    with app.app_context():
+        event.listen(fa.db.engine, 'before_cursor_execute', lambda conn, cur, sql, *args: statements.append(sql))
+    assert taker.post('/quick_play', data={'tier': '1k', 'guess': 'RED'}).status_code == 302
+    assert len(statements) < 30
+    assert fa._match_queues[1000] == {}
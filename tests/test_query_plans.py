@@ -0,0 +1,11 @@
+"""Hot query shapes must stay index-backed on a freshly migrated database (see QUERY PLAN CHECK)."""
+import file_admin as fa
+
+def test_hot_queries_use_indexes(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'plans.db'}")
+    app = fa.create_app()
+    with app.app_context():
+        fa.migrate()
+        plans = fa.query_plans()
+        assert set(plans) == set(fa.hot_queries())
+        assert fa.full_scans(plans) == {}
@@ -0,0 +1,49 @@
+"""@replica_reads views must send their SELECTs to the replica bind, for both replica kinds."""
+import sqlite3
+import time
+
+import pytest
+
+import file_admin as fa
+
+def replica_app(tmp_path, monkeypatch, mode):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'primary.db'}")
+    snapshot = str(tmp_path / 'replica.db')
+    monkeypatch.setattr(fa, 'REPLICA_ENABLED', True)
+    monkeypatch.setattr(fa, 'REPLICA_SNAPSHOT', snapshot if mode == 'snapshot' else None)
+    monkeypatch.setattr(fa, 'REPLICA_DATABASE_URL', f'sqlite:///{snapshot}' if mode == 'url' else None)
+    monkeypatch.setattr(fa, '_replica_state', {'checked': 0.0, 'inode': None, 'as_of': 0.0})
+    app = fa.create_app()
+    with app.app_context():
+        fa.migrate()
+        fa.db.session.add(fa.User(id=1, username='boss', password='x', is_admin=True))
+        fa.db.session.commit()
+        if mode == 'snapshot':
+            fa.refresh_replica_snapshot()
+        else: # Stands in for a server replica: a copy the app never refreshes
+            with sqlite3.connect(str(tmp_path / 'primary.db')) as src, sqlite3.connect(snapshot) as dst: src.backup(dst)
+    return app
+
+def admin_client(app):
+    client = app.test_client()
+    with client.session_transaction() as sess: sess['_user_id'] = '1'
+    return client
+
+def replica_statements():
+    return fa._bind_sql.get('replica', [0])[0]
+
+@pytest.mark.parametrize('mode', ['snapshot', 'url'])
+def test_replica_reads_view_uses_replica(tmp_path, monkeypatch, mode):
+    app = replica_app(tmp_path, monkeypatch, mode)
+    time.sleep(fa.REPLICA_ASSUMED_LAG + 0.1 if mode == 'url' else 0.1) # Past the user's own writes
+    before = replica_statements()
+    assert admin_client(app).get('/admin').status_code == 200
+    assert replica_statements() > before
+
+def test_own_write_reads_primary(tmp_path, monkeypatch):
+    app = replica_app(tmp_path, monkeypatch, 'url')
+    client = admin_client(app)
+    with client.session_transaction() as sess: sess['wrote_at'] = time.time()
+    before = replica_statements()
+    assert client.get('/admin').status_code == 200
+    assert replica_statements() == before